@@ -1,5 +1,4 @@
 """Configuration module."""
-from .database import get_engine, init_db, get_session
-
-__all__ = ["get_engine", "init_db", "get_session"]
+from .database import get_engine, init_db, get_session, create_session
 
+__all__ = ["get_engine", "init_db", "get_session", "create_session"]
@@ -1,15 +1,19 @@
 """
 Database configuration and connection setup.
-Handles database connection using SQLModel and PostgreSQL.
+Handles async database connection using SQLModel, SQLAlchemy and asyncpg.
 Supports both DATABASE_URL and individual environment variables.
 """
+import functools
 import os
 import re
+import shlex
 import logging
-from typing import Generator, Optional
-from sqlmodel import SQLModel, create_engine, Session
-from sqlalchemy import Engine
-from sqlalchemy.exc import OperationalError
+from typing import AsyncGenerator, Tuple
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import OperationalError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -18,6 +22,14 @@ load_dotenv()
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns for database URL handling
+_PSQL_PREFIX_RE = re.compile(r'^psql\s+', re.IGNORECASE)
+_PASSWORD_MASK_RE = re.compile(r':([^:@]+)@')
+
+# URL query parameters the SQLAlchemy asyncpg dialect understands; any other
+# (libpq) parameter would be passed to asyncpg.connect and raise TypeError
+_ASYNCPG_URL_PARAMS = frozenset({"host", "port", "prepared_statement_cache_size"})
+
 
 def clean_database_url(url: str) -> str:
     """
@@ -30,7 +42,7 @@ def clean_database_url(url: str) -> str:
         Cleaned database URL
     """
     # Remove 'psql' command prefix if present
-    url = re.sub(r'^psql\s+', '', url, flags=re.IGNORECASE)
+    url = _PSQL_PREFIX_RE.sub('', url)
     
     # Remove single or double quotes
     url = url.strip("'\"")
@@ -41,6 +53,87 @@ def clean_database_url(url: str) -> str:
     return url
 
 
+def _parse_libpq_options(options: str) -> dict:
+    """
+    Parse a libpq ``options`` string (``-c key=value ...``) into server settings.
+    
+    Args:
+        options: Value of the libpq ``options`` parameter
+        
+    Returns:
+        Dict of server setting name to value
+    """
+    settings = {}
+    args = shlex.split(options)
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg == "-c" and i + 1 < len(args):
+            i += 1
+            arg = args[i]
+        elif arg.startswith("-c"):
+            arg = arg[2:]
+        elif arg.startswith("--"):
+            arg = arg[2:]
+        key, sep, value = arg.partition("=")
+        if sep:
+            settings[key.replace("-", "_")] = value
+        else:
+            logger.warning(f"Ignoring unsupported database option: {args[i]}")
+        i += 1
+    return settings
+
+
+def to_async_database_url(url: str) -> Tuple[str, dict]:
+    """
+    Convert a PostgreSQL URL to use the asyncpg driver.
+    
+    asyncpg does not understand libpq query parameters, and SQLAlchemy passes
+    query parameters straight to ``asyncpg.connect``. ``sslmode``,
+    ``connect_timeout``, ``application_name`` and ``options`` are translated
+    into ``connect_args``, ``channel_binding`` is dropped, and any other libpq
+    parameter is dropped with a warning.
+    
+    Args:
+        url: PostgreSQL database URL
+        
+    Returns:
+        Tuple of (asyncpg database URL, connect_args)
+    """
+    parsed = make_url(url)
+    query = dict(parsed.query)
+    connect_args = {}
+    server_settings = {}
+    
+    sslmode = query.pop("sslmode", None)
+    query.pop("channel_binding", None)  # asyncpg negotiates SCRAM channel binding itself
+    if sslmode:
+        connect_args["ssl"] = sslmode
+    
+    connect_timeout = query.pop("connect_timeout", None)
+    if connect_timeout:
+        connect_args["timeout"] = float(connect_timeout)
+    
+    options = query.pop("options", None)
+    if options:
+        server_settings.update(_parse_libpq_options(options))
+    
+    application_name = query.pop("application_name", None)
+    if application_name:
+        server_settings["application_name"] = application_name
+    
+    if server_settings:
+        connect_args["server_settings"] = server_settings
+    
+    for key in list(query):
+        if key not in _ASYNCPG_URL_PARAMS:
+            logger.warning(f"Ignoring database URL parameter not supported by asyncpg: {key}")
+            del query[key]
+    
+    parsed = parsed.set(drivername="postgresql+asyncpg", query=query)
+    return parsed.render_as_string(hide_password=False), connect_args
+
+
 class DatabaseConfig:
     """Database configuration class."""
     
@@ -72,46 +165,43 @@ class DatabaseConfig:
             # Construct URL from individual variables
             return f"postgresql://{self.db_user}:{self.db_password}@{self.db_host}:{self.db_port}/{self.db_name}"
     
-    def create_engine(self, echo: bool = False) -> Engine:
-        """Create and return database engine."""
+    def create_engine(self, echo: bool = False) -> AsyncEngine:
+        """Create and return async database engine."""
         url = self.database_url
         
         # Log connection info (without sensitive data)
         if self._database_url:
             # Mask password in URL for logging
-            safe_url = re.sub(r':([^:@]+)@', ':****@', url)
+            safe_url = _PASSWORD_MASK_RE.sub(':****@', url)
             logger.info(f"Connecting to database: {safe_url}")
         else:
             logger.info(f"Connecting to database: {self.db_host}:{self.db_port}/{self.db_name}")
         
-        return create_engine(
-            url,
+        async_url, connect_args = to_async_database_url(url)
+        
+        return create_async_engine(
+            async_url,
             echo=echo,
             pool_pre_ping=True,  # Verify connections before using
-            pool_recycle=3600,   # Recycle connections after 1 hour
-            connect_args={
-                # These will be handled by the URL parameters if present
-                # But we can add additional SSL args if needed
-            }
+            pool_size=int(os.getenv("DB_POOL_SIZE", 10)),
+            max_overflow=int(os.getenv("DB_MAX_OVERFLOW", 20)),
+            pool_recycle=int(os.getenv("DB_POOL_RECYCLE", 1800)),  # Recycle connections after 30 minutes
+            pool_timeout=30,
+            connect_args=connect_args
         )
 
 
 # Initialize database configuration
 db_config = DatabaseConfig()
 
-# Create engine instance (lazy initialization)
-_engine: Optional[Engine] = None
 
+@functools.lru_cache(maxsize=1)
+def get_engine() -> AsyncEngine:
+    """Get or create database engine instance (created once, lazily)."""
+    return db_config.create_engine(echo=False)
 
-def get_engine() -> Engine:
-    """Get or create database engine instance."""
-    global _engine
-    if _engine is None:
-        _engine = db_config.create_engine(echo=False)
-    return _engine
 
-
-def init_db() -> bool:
+async def init_db() -> bool:
     """
     Initialize database by creating all tables.
     
@@ -124,7 +214,8 @@ def init_db() -> bool:
         
         engine = get_engine()
         logger.info("Attempting to connect to database and create tables...")
-        SQLModel.metadata.create_all(engine)
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
         logger.info("Database tables created successfully!")
         return True
     except OperationalError as e:
@@ -139,18 +230,24 @@ def init_db() -> bool:
         return False
 
 
-def get_session() -> Generator[Session, None, None]:
-    """Get database session for dependency injection."""
-    engine = get_engine()
-    with Session(engine) as session:
+def create_session() -> AsyncSession:
+    """Create a new async database session bound to the shared engine."""
+    return AsyncSession(get_engine(), expire_on_commit=False, autoflush=False)
+
+
+async def get_session() -> AsyncGenerator[AsyncSession, None]:
+    """Get async database session for dependency injection."""
+    async with create_session() as session:
         try:
             yield session
         except OperationalError as e:
             logger.error(f"Database connection error: {str(e)}")
-            session.rollback()
+            await session.rollback()
             raise
-        except Exception as e:
+        except SQLAlchemyError as e:
+            # Other errors (e.g. request validation) pass through unlogged;
+            # closing the session rolls back any open transaction
             logger.error(f"Database error: {str(e)}")
-            session.rollback()
+            await session.rollback()
             raise
 
@@ -2,11 +2,39 @@
 Controller for SupportMessage business logic.
 Handles CRUD operations and business rules.
 """
-from typing import List, Optional
-from sqlmodel import Session, select
-from fastapi import HTTPException, status
-from ..models import SupportMessage, SupportMessageCreate, SupportMessageUpdate
-from ..utils import validate_support_message_data, generate_ai_response
+import logging
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncScalarResult
+from fastapi import BackgroundTasks, HTTPException, status
+from ..config import create_session
+from ..models import (
+    SupportMessage,
+    SupportMessageCreate,
+    SupportMessageUpdate,
+    SupportMessageResponse
+)
+from ..utils import generate_ai_response
+
+logger = logging.getLogger(__name__)
+
+# Number of rows fetched per round trip when streaming support messages
+STREAM_BATCH_SIZE = 100
+
+# Per-process LRU cache of support messages served by ID. Invalidation only
+# reaches the worker that handled the update or delete, so entries also expire
+# after MESSAGE_CACHE_TTL seconds to bound staleness across workers
+MESSAGE_CACHE_SIZE = 2048
+MESSAGE_CACHE_TTL = 30.0
+_message_cache: "OrderedDict[int, Tuple[float, SupportMessageResponse]]" = OrderedDict()
+
+
+def _invalidate_cached_message(message_id: int) -> None:
+    """Drop a support message from the read cache."""
+    _message_cache.pop(message_id, None)
 
 
 class SupportMessageController:
@@ -14,36 +42,26 @@ class SupportMessageController:
     
     @staticmethod
     async def create_support_message(
-        session: Session,
-        message_data: SupportMessageCreate
+        session: AsyncSession,
+        message_data: SupportMessageCreate,
+        background_tasks: BackgroundTasks
     ) -> SupportMessage:
         """
-        Create a new support message with AI-generated response.
+        Create a new support message and schedule its AI-generated response.
         
-        This method:
-        1. Validates the input data
-        2. Creates a new support message record
-        3. Generates an AI response using the AI agent
-        4. Updates the record with the AI response
-        5. Returns the complete message with AI response
+        Input is already validated by SupportMessageCreate. This method:
+        1. Creates a new support message record (without AI response)
+        2. Schedules AI response generation to run after the response is sent
+        3. Returns the saved message immediately
         
         Args:
             session: Database session
             message_data: Support message data
+            background_tasks: FastAPI background tasks for the current request
             
         Returns:
-            Created SupportMessage instance with AI response
-            
-        Raises:
-            HTTPException: If validation fails
+            Created SupportMessage instance (ai_response is filled in later)
         """
-        # Validate input data
-        validate_support_message_data(
-            message_data.name,
-            message_data.email,
-            message_data.message
-        )
-        
         # Create new support message (without AI response initially)
         support_message = SupportMessage(
             name=message_data.name,
@@ -52,47 +70,77 @@ class SupportMessageController:
         )
         
         session.add(support_message)
-        session.commit()
-        session.refresh(support_message)
+        await session.flush()
+        await session.commit()
+        
+        # Generate the AI response once the HTTP response has been sent
+        background_tasks.add_task(
+            SupportMessageController.generate_and_store_ai_response,
+            support_message.id,
+            message_data.message,
+            message_data.name,
+            message_data.email
+        )
+        
+        return support_message
+    
+    @staticmethod
+    async def generate_and_store_ai_response(
+        message_id: int,
+        user_message: str,
+        customer_name: Optional[str] = None,
+        customer_email: Optional[str] = None
+    ) -> None:
+        """
+        Generate an AI response and store it on an existing support message.
         
-        # Generate AI response asynchronously
+        Runs as a background task, so it opens its own database session
+        instead of reusing the (already closed) request session.
+        
+        Args:
+            message_id: Support message ID
+            user_message: The customer's support message
+            customer_name: Optional customer name for personalization
+            customer_email: Optional customer email
+        """
         try:
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.info("🤖 Starting AI response generation...")
-            logger.info(f"   Message: {message_data.message[:100]}...")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("🤖 Starting AI response generation...")
+                logger.info(f"   Message: {user_message[:100]}...")
             
             ai_response = await generate_ai_response(
-                user_message=message_data.message,
-                customer_name=message_data.name,
-                customer_email=message_data.email
+                user_message=user_message,
+                customer_name=customer_name,
+                customer_email=customer_email
             )
             
-            logger.info(f"📝 AI response received (length: {len(ai_response) if ai_response else 0})")
-            logger.info(f"   Response preview: {ai_response[:100] if ai_response else 'None'}...")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"📝 AI response received (length: {len(ai_response) if ai_response else 0})")
+                logger.info(f"   Response preview: {ai_response[:100] if ai_response else 'None'}...")
             
             # Update the support message with AI response
-            support_message.ai_response = ai_response
-            session.add(support_message)
-            session.commit()
-            session.refresh(support_message)
+            async with create_session() as session:
+                support_message = await session.get(SupportMessage, message_id)
+                if not support_message:
+                    # Message was deleted before the AI response was ready
+                    return
+                
+                support_message.ai_response = ai_response
+                session.add(support_message)
+                await session.commit()
+            _invalidate_cached_message(message_id)
             
             logger.info("✅ AI response saved to database")
             
         except Exception as e:
-            # Log error but don't fail the request
-            # The message is already saved, AI response can be added later
-            import logging
-            logger = logging.getLogger(__name__)
+            # Log error; the message is already saved and the AI response
+            # can be added later
             logger.error(f"❌ Failed to generate AI response: {str(e)}")
             logger.exception(e)
-            # Continue without AI response - it can be generated later
-        
-        return support_message
     
     @staticmethod
-    def get_support_message(
-        session: Session,
+    async def get_support_message(
+        session: AsyncSession,
         message_id: int
     ) -> SupportMessage:
         """
@@ -108,8 +156,8 @@ class SupportMessageController:
         Raises:
             HTTPException: If message not found
         """
-        statement = select(SupportMessage).where(SupportMessage.id == message_id)
-        support_message = session.exec(statement).first()
+        # Primary-key lookup checks the identity map before issuing SQL
+        support_message = await session.get(SupportMessage, message_id)
         
         if not support_message:
             raise HTTPException(
@@ -120,8 +168,51 @@ class SupportMessageController:
         return support_message
     
     @staticmethod
-    def get_all_support_messages(
-        session: Session,
+    async def get_support_message_cached(
+        session: AsyncSession,
+        message_id: int
+    ) -> SupportMessageResponse:
+        """
+        Get a support message by ID, served from the in-memory LRU cache when possible.
+        
+        Only messages that already have an AI response are cached, since a
+        pending response is filled in later by a background task. Entries
+        expire after MESSAGE_CACHE_TTL seconds.
+        
+        Args:
+            session: Database session
+            message_id: Support message ID
+            
+        Returns:
+            SupportMessageResponse snapshot of the message
+            
+        Raises:
+            HTTPException: If message not found
+        """
+        now = time.monotonic()
+        cached = _message_cache.get(message_id)
+        if cached is not None:
+            cached_at, cached_response = cached
+            if now - cached_at < MESSAGE_CACHE_TTL:
+                _message_cache.move_to_end(message_id)
+                return cached_response
+            del _message_cache[message_id]
+        
+        support_message = await SupportMessageController.get_support_message(
+            session, message_id
+        )
+        response = SupportMessageResponse.model_validate(support_message)
+        
+        if response.ai_response is not None:
+            _message_cache[message_id] = (now, response)
+            if len(_message_cache) > MESSAGE_CACHE_SIZE:
+                _message_cache.popitem(last=False)
+        
+        return response
+    
+    @staticmethod
+    async def get_all_support_messages(
+        session: AsyncSession,
         skip: int = 0,
         limit: int = 100
     ) -> List[SupportMessage]:
@@ -137,12 +228,41 @@ class SupportMessageController:
             List of SupportMessage instances
         """
         statement = select(SupportMessage).offset(skip).limit(limit)
-        support_messages = session.exec(statement).all()
+        result = await session.exec(statement)
+        support_messages = result.all()
         return list(support_messages)
     
     @staticmethod
-    def update_support_message(
-        session: Session,
+    async def stream_all_support_messages(
+        session: AsyncSession,
+        skip: int = 0,
+        limit: int = 100
+    ) -> AsyncScalarResult[SupportMessage]:
+        """
+        Stream all support messages with pagination.
+        
+        Rows are fetched from a server-side cursor in batches of
+        STREAM_BATCH_SIZE instead of being materialized all at once.
+        
+        Args:
+            session: Database session
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            
+        Returns:
+            Async result yielding SupportMessage instances
+        """
+        statement = (
+            select(SupportMessage)
+            .offset(skip)
+            .limit(limit)
+            .execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
+        return await session.stream_scalars(statement)
+    
+    @staticmethod
+    async def update_support_message(
+        session: AsyncSession,
         message_id: int,
         message_data: SupportMessageUpdate
     ) -> SupportMessage:
@@ -158,34 +278,29 @@ class SupportMessageController:
             Updated SupportMessage instance
             
         Raises:
-            HTTPException: If message not found or validation fails
+            HTTPException: If message not found
         """
-        support_message = SupportMessageController.get_support_message(
+        support_message = await SupportMessageController.get_support_message(
             session, message_id
         )
         
         # Update fields if provided
+        # Fields were already validated by SupportMessageUpdate
         update_data = message_data.model_dump(exclude_unset=True)
         
-        if "name" in update_data or "email" in update_data or "message" in update_data:
-            name = update_data.get("name", support_message.name)
-            email = update_data.get("email", support_message.email)
-            message = update_data.get("message", support_message.message)
-            
-            validate_support_message_data(name, email, message)
-        
         for key, value in update_data.items():
             setattr(support_message, key, value)
         
         session.add(support_message)
-        session.commit()
-        session.refresh(support_message)
+        await session.commit()
+        await session.refresh(support_message)
+        _invalidate_cached_message(message_id)
         
         return support_message
     
     @staticmethod
-    def delete_support_message(
-        session: Session,
+    async def delete_support_message(
+        session: AsyncSession,
         message_id: int
     ) -> None:
         """
@@ -198,22 +313,23 @@ class SupportMessageController:
         Raises:
             HTTPException: If message not found
         """
-        support_message = SupportMessageController.get_support_message(
+        support_message = await SupportMessageController.get_support_message(
             session, message_id
         )
         
-        session.delete(support_message)
-        session.commit()
+        await session.delete(support_message)
+        await session.commit()
+        _invalidate_cached_message(message_id)
     
     @staticmethod
-    def get_support_messages_by_email(
-        session: Session,
+    async def get_support_messages_by_email(
+        session: AsyncSession,
         email: str,
         skip: int = 0,
         limit: int = 100
     ) -> List[SupportMessage]:
         """
-        Get all support messages by email address.
+        Get all support messages by email address, newest first.
         
         Args:
             session: Database session
@@ -227,9 +343,11 @@ class SupportMessageController:
         statement = (
             select(SupportMessage)
             .where(SupportMessage.email == email)
+            .order_by(SupportMessage.created_at.desc())
             .offset(skip)
             .limit(limit)
         )
-        support_messages = session.exec(statement).all()
+        result = await session.exec(statement)
+        support_messages = result.all()
         return list(support_messages)
 
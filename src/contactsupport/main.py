@@ -2,26 +2,72 @@
 Main FastAPI application.
 Entry point for the Contact Support API.
 """
+import time
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from sqlalchemy.exc import SQLAlchemyError
 
-from .config import init_db
 from .routes import support_message_router
 from .middleware import (
     validation_exception_handler,
     database_exception_handler,
     general_exception_handler
 )
-# Import models to ensure they're registered
-from .models import SupportMessage
+
+# Gemini key details that cannot change at runtime, computed once
+_cached_ai_status: dict = {}
+
+# Seconds a healthy /health result is reused before the database is probed again
+HEALTH_CACHE_TTL = 10.0
+_health_cache: dict = {"last_status": None, "last_ok_ts": 0.0}
+
+
+def _get_gemini_key_status() -> dict:
+    """Build the static part of the Gemini health status from the API key."""
+    from .utils.ai_agent import get_gemini_api_key
+    
+    gemini_key = get_gemini_api_key()
+    key_status = {
+        "api_key_present": gemini_key is not None and len(gemini_key) > 0
+    }
+    if key_status["api_key_present"]:
+        key_status["api_key_length"] = len(gemini_key)
+        key_status["api_key_preview"] = f"{gemini_key[:10]}...{gemini_key[-5:]}"
+    return key_status
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize database and AI agent on startup."""
+    # Startup-only dependencies are imported here to keep module import light
+    from .config import init_db
+    
+    await init_db()
+    
+    # Initialize AI agent and check configuration
+    try:
+        from .utils.ai_agent import get_ai_agent, get_gemini_api_key
+        _cached_ai_status.update(_get_gemini_key_status())
+        if get_gemini_api_key():
+            # Build the client and agent now rather than on the first request
+            get_ai_agent().agent
+    except Exception:
+        pass
+    
+    yield
+
 
 # Create FastAPI application
 app = FastAPI(
     title="Contact Support API",
     description="API for managing customer support messages with AI responses",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -42,31 +88,6 @@ app.add_exception_handler(Exception, general_exception_handler)
 app.include_router(support_message_router)
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize database on startup."""
-    success = init_db()
-    if success:
-        pass
-    else:
-        pass
-    
-    # Initialize AI agent and check configuration
-    try:
-        from .utils.ai_agent import get_ai_agent, get_gemini_api_key
-        gemini_key = get_gemini_api_key()
-        if gemini_key:
-            agent = get_ai_agent()
-            if agent.gemini_client:
-                pass
-            else:
-                pass
-        else:
-            pass
-    except Exception as e:
-        pass
-
-
 @app.get("/", tags=["Health"])
 async def root():
     """Root endpoint for health check."""
@@ -82,11 +103,20 @@ async def health_check():
     """
     Health check endpoint.
     Checks if the application and database are running.
+    A healthy result is reused for HEALTH_CACHE_TTL seconds to avoid probing
+    the database on every liveness probe; failures are always re-checked.
     """
     from sqlalchemy import text
     from sqlalchemy.exc import OperationalError
     from .config import get_engine
     
+    now = time.monotonic()
+    if (
+        _health_cache["last_status"] is not None
+        and now - _health_cache["last_ok_ts"] < HEALTH_CACHE_TTL
+    ):
+        return _health_cache["last_status"]
+    
     health_status = {
         "status": "healthy",
         "database": "unknown"
@@ -94,8 +124,8 @@ async def health_check():
     
     try:
         engine = get_engine()
-        with engine.connect() as conn:
-            result = conn.execute(text("SELECT 1"))
+        async with engine.connect() as conn:
+            result = await conn.execute(text("SELECT 1"))
             result.fetchone()  # Execute the query
         health_status["database"] = "connected"
     except OperationalError:
@@ -105,6 +135,11 @@ async def health_check():
         health_status["database"] = f"error: {str(e)}"
         health_status["status"] = "degraded"
     
+    if health_status["status"] == "healthy":
+        _health_cache["last_status"] = health_status
+        _health_cache["last_ok_ts"] = now
+    else:
+        _health_cache["last_status"] = None
     return health_status
 
 
@@ -114,7 +149,7 @@ async def ai_health_check():
     AI service health check endpoint.
     Checks if AI services (Gemini) are configured and available.
     """
-    from .utils.ai_agent import get_ai_agent, get_gemini_api_key
+    from .utils.ai_agent import get_ai_agent
     
     ai_status = {
         "gemini": {
@@ -125,17 +160,15 @@ async def ai_health_check():
         }
     }
     
-    # Check Gemini
-    gemini_key = get_gemini_api_key()
-    ai_status["gemini"]["api_key_present"] = gemini_key is not None and len(gemini_key) > 0
-    if ai_status["gemini"]["api_key_present"]:
-        ai_status["gemini"]["api_key_length"] = len(gemini_key)
-        ai_status["gemini"]["api_key_preview"] = f"{gemini_key[:10]}...{gemini_key[-5:]}"
+    # Check Gemini (key details are cached, only the client is checked live)
+    if not _cached_ai_status:
+        _cached_ai_status.update(_get_gemini_key_status())
+    ai_status["gemini"].update(_cached_ai_status)
     
     # Check agent initialization
     try:
         agent = get_ai_agent()
-        ai_status["gemini"]["client_initialized"] = agent.gemini_client is not None
+        ai_status["gemini"]["client_initialized"] = agent.gemini_client
         ai_status["gemini"]["configured"] = ai_status["gemini"]["client_initialized"]
         
         if ai_status["gemini"]["client_initialized"]:
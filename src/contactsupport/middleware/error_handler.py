@@ -3,7 +3,7 @@ Middleware for error handling.
 Provides centralized error handling for the application.
 """
 from fastapi import Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -11,7 +11,7 @@ from sqlalchemy.exc import SQLAlchemyError
 async def validation_exception_handler(
     request: Request,
     exc: RequestValidationError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Handle validation errors.
     
@@ -22,19 +22,16 @@ async def validation_exception_handler(
     Returns:
         JSON response with error details
     """
-    errors = exc.errors()
-    error_messages = []
-    
-    for error in errors:
-        field = " -> ".join(str(loc) for loc in error["loc"])
-        message = error["msg"]
-        error_messages.append(f"{field}: {message}")
-    
-    return JSONResponse(
+    # Pass pydantic-core's error dicts through, minus "ctx"/"input" which may
+    # hold objects (e.g. the raised ValueError) that orjson cannot serialize
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "detail": "Validation error",
-            "errors": error_messages
+            "errors": [
+                {"loc": error["loc"], "msg": error["msg"], "type": error["type"]}
+                for error in exc.errors()
+            ]
         }
     )
 
@@ -42,7 +39,7 @@ async def validation_exception_handler(
 async def database_exception_handler(
     request: Request,
     exc: SQLAlchemyError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Handle database errors.
     
@@ -53,7 +50,7 @@ async def database_exception_handler(
     Returns:
         JSON response with error details
     """
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "detail": "Database error occurred",
@@ -65,7 +62,7 @@ async def database_exception_handler(
 async def general_exception_handler(
     request: Request,
     exc: Exception
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Handle general exceptions.
     
@@ -76,7 +73,7 @@ async def general_exception_handler(
     Returns:
         JSON response with error details
     """
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "detail": "Internal server error",
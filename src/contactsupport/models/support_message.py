@@ -4,8 +4,15 @@ Represents a support message with AI response.
 """
 from datetime import datetime
 from typing import Optional
+from pydantic import field_validator
 from sqlmodel import SQLModel, Field, Column, DateTime
-from sqlalchemy import func
+from sqlalchemy import Index, func, text
+from ..utils.validators import (
+    MAX_MESSAGE_LENGTH,
+    ensure_valid_name,
+    ensure_valid_email,
+    ensure_valid_message
+)
 
 
 class SupportMessage(SQLModel, table=True):
@@ -21,15 +28,20 @@ class SupportMessage(SQLModel, table=True):
         created_at: Timestamp when the message was created
     """
     __tablename__ = "support_message"
+    __table_args__ = (
+        # Serves "messages by email, newest first" without an extra sort
+        Index("ix_support_message_email_created_at", "email", text("created_at DESC")),
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str = Field(max_length=255, nullable=False)
     email: str = Field(max_length=255, nullable=False, index=True)
     message: str = Field(nullable=False)
     ai_response: Optional[str] = Field(default=None, nullable=True)
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow,
-        sa_column=Column(DateTime(timezone=True), server_default=func.now())
+    # Populated by the database on insert
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     )
 
 
@@ -37,15 +49,46 @@ class SupportMessageCreate(SQLModel):
     """Schema for creating a new support message."""
     name: str = Field(max_length=255)
     email: str = Field(max_length=255)
-    message: str
+    # Length is enforced by pydantic-core before any Python validator runs
+    message: str = Field(max_length=MAX_MESSAGE_LENGTH)
+    
+    @field_validator("name")
+    @classmethod
+    def check_name(cls, value: str) -> str:
+        return ensure_valid_name(value)
+    
+    @field_validator("email")
+    @classmethod
+    def check_email(cls, value: str) -> str:
+        return ensure_valid_email(value)
+    
+    @field_validator("message")
+    @classmethod
+    def check_message(cls, value: str) -> str:
+        return ensure_valid_message(value)
 
 
 class SupportMessageUpdate(SQLModel):
     """Schema for updating a support message."""
     name: Optional[str] = Field(default=None, max_length=255)
     email: Optional[str] = Field(default=None, max_length=255)
-    message: Optional[str] = Field(default=None)
+    message: Optional[str] = Field(default=None, max_length=MAX_MESSAGE_LENGTH)
     ai_response: Optional[str] = Field(default=None)
+    
+    @field_validator("name")
+    @classmethod
+    def check_name(cls, value: Optional[str]) -> Optional[str]:
+        return value if value is None else ensure_valid_name(value)
+    
+    @field_validator("email")
+    @classmethod
+    def check_email(cls, value: Optional[str]) -> Optional[str]:
+        return value if value is None else ensure_valid_email(value)
+    
+    @field_validator("message")
+    @classmethod
+    def check_message(cls, value: Optional[str]) -> Optional[str]:
+        return value if value is None else ensure_valid_message(value)
 
 
 class SupportMessageResponse(SQLModel):
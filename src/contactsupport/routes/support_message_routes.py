@@ -2,38 +2,76 @@
 Routes for SupportMessage API endpoints.
 RESTful API design with proper error handling.
 """
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlmodel import Session
+from typing import AsyncIterator, List
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncScalarResult
+from sqlmodel.ext.asyncio.session import AsyncSession
 from ..config import get_session
 from ..models import (
+    SupportMessage,
     SupportMessageCreate,
     SupportMessageResponse
 )
 from ..controllers import SupportMessageController
 
+# Every route depends on the same module-level get_session symbol so FastAPI's
+# per-request dependency cache (keyed on the callable) hands out one session per
+# request. scope="request" keeps the session open until the response, including
+# any background tasks, has been sent, which the streaming list endpoint relies
+# on. The create endpoint uses scope="function" instead, so its session is
+# closed before the AI response background task runs.
 router = APIRouter(
     prefix="/api/support-messages",
     tags=["Support Messages"]
 )
 
 
+async def _stream_json_array(
+    support_messages: AsyncScalarResult[SupportMessage]
+) -> AsyncIterator[bytes]:
+    """
+    Serialize streamed support messages as a JSON array, one batch at a time.
+    
+    Args:
+        support_messages: Async result yielding SupportMessage instances
+        
+    Yields:
+        Chunks of the JSON array body
+    """
+    yield b"["
+    separator = ""
+    async for batch in support_messages.partitions():
+        chunk = ",".join(
+            SupportMessageResponse.model_validate(msg).model_dump_json()
+            for msg in batch
+        )
+        yield f"{separator}{chunk}".encode()
+        separator = ","
+    yield b"]"
+
+
 @router.post(
     "/",
     response_model=SupportMessageResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Create a new support message",
-    description="Create a new support message with name, email, and message"
+    description=(
+        "Create a new support message with name, email, and message. "
+        "The AI response is generated in the background and stored on the message."
+    )
 )
 async def create_support_message(
     message_data: SupportMessageCreate,
-    session: Session = Depends(get_session)
-) -> SupportMessageResponse:
+    background_tasks: BackgroundTasks,
+    session: AsyncSession = Depends(get_session, scope="function")
+) -> SupportMessage:
     """
     Create a new support message.
     
     Args:
         message_data: Support message data
+        background_tasks: Background tasks used to generate the AI response
         session: Database session
         
     Returns:
@@ -41,9 +79,10 @@ async def create_support_message(
     """
     try:
         support_message = await SupportMessageController.create_support_message(
-            session, message_data
+            session, message_data, background_tasks
         )
-        return SupportMessageResponse.model_validate(support_message)
+        # Serialized once through response_model
+        return support_message
     except HTTPException:
         raise
     except Exception as e:
@@ -62,30 +101,65 @@ async def create_support_message(
 async def get_all_support_messages(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
-    session: Session = Depends(get_session)
-) -> List[SupportMessageResponse]:
+    session: AsyncSession = Depends(get_session, scope="request")
+) -> StreamingResponse:
     """
     Get all support messages with pagination.
     
+    Rows are streamed from the database and serialized in batches so memory
+    stays bounded regardless of ``limit``.
+    
     Args:
         skip: Number of records to skip
         limit: Maximum number of records to return
         session: Database session
         
     Returns:
-        List of support messages
+        Streaming JSON array of support messages
     """
     try:
-        support_messages = SupportMessageController.get_all_support_messages(
+        support_messages = await SupportMessageController.stream_all_support_messages(
             session, skip, limit
         )
-        return [
-            SupportMessageResponse.model_validate(msg) 
-            for msg in support_messages
-        ]
+        return StreamingResponse(
+            _stream_json_array(support_messages),
+            media_type="application/json"
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to retrieve support messages: {str(e)}"
         )
 
+
+@router.get(
+    "/{message_id}",
+    response_model=SupportMessageResponse,
+    summary="Get a support message",
+    description="Get a specific support message by ID"
+)
+async def get_support_message(
+    message_id: int,
+    session: AsyncSession = Depends(get_session, scope="request")
+) -> SupportMessageResponse:
+    """
+    Get a support message by ID.
+    
+    Args:
+        message_id: Support message ID
+        session: Database session
+        
+    Returns:
+        Support message
+    """
+    try:
+        return await SupportMessageController.get_support_message_cached(
+            session, message_id
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve support message: {str(e)}"
+        )
@@ -7,7 +7,7 @@ CREATE TABLE IF NOT EXISTS support_message (
     email VARCHAR(255) NOT NULL,
     message TEXT NOT NULL,
     ai_response TEXT,
-    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP
 );
 
 -- Create index on email for faster queries
@@ -16,3 +16,5 @@ CREATE INDEX IF NOT EXISTS idx_support_message_email ON support_message(email);
 -- Create index on created_at for faster sorting
 CREATE INDEX IF NOT EXISTS idx_support_message_created_at ON support_message(created_at);
 
+-- Create composite index for listing messages by email, newest first
+CREATE INDEX IF NOT EXISTS ix_support_message_email_created_at ON support_message(email, created_at DESC);
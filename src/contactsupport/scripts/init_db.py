@@ -2,6 +2,7 @@
 Database initialization script.
 Creates the SupportMessage table in the database.
 """
+import asyncio
 import sys
 from pathlib import Path
 
@@ -15,7 +16,7 @@ from contactsupport.models import SupportMessage
 def create_tables():
     """Create all database tables."""
     print("Initializing database...")
-    success = init_db()
+    success = asyncio.run(init_db())
     if success:
         print("Database initialized successfully!")
         print("Table 'support_message' has been created.")
@@ -1,15 +1,30 @@
 """Utils module."""
-from .validators import validate_email, validate_support_message_data
+from .validators import (
+    validate_email,
+    validate_support_message_data,
+    ensure_valid_name,
+    ensure_valid_email,
+    ensure_valid_message
+)
 from .ai_agent import generate_ai_response, get_ai_agent, AIAgent
-from .faq_knowledge_base import find_matching_faq, get_all_faqs, format_faqs_for_prompt
+from .faq_knowledge_base import (
+    find_matching_faq,
+    get_all_faqs,
+    format_faqs_for_prompt,
+    format_faqs_as_json
+)
 
 __all__ = [
     "validate_email",
     "validate_support_message_data",
+    "ensure_valid_name",
+    "ensure_valid_email",
+    "ensure_valid_message",
     "generate_ai_response",
     "get_ai_agent",
     "AIAgent",
     "find_matching_faq",
     "get_all_faqs",
-    "format_faqs_for_prompt"
+    "format_faqs_for_prompt",
+    "format_faqs_as_json"
 ]
@@ -2,21 +2,77 @@
 AI Agent Module for Customer Support
 Uses the agents library with Gemini API for response generation.
 """
+import asyncio
+import functools
 import os
-from typing import Optional
-from dotenv import load_dotenv
-from agents import Agent, Runner, AsyncOpenAI, OpenAIChatCompletionsModel
-from agents.run import RunConfig
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
-# Load the environment variables from the .env file
-load_dotenv()
+if TYPE_CHECKING:
+    from agents import Agent
 
 # Mock response when API key is missing
 MOCK_RESPONSE = "Thank you for your message. Our support team will reach out shortly."
 
+# Gemini response cache settings
+RESPONSE_CACHE_SIZE = 1024
+RESPONSE_CACHE_TTL = 300.0  # seconds
 
+# Messages longer than this rarely repeat, so they bypass the response cache
+# and in-flight coalescing instead of pinning up to MAX_MESSAGE_LENGTH
+# characters per key
+RESPONSE_CACHE_MAX_KEY_LENGTH = 256
+
+
+class _ResponseCache:
+    """LRU cache of Gemini responses with a time-to-live per entry."""
+    
+    def __init__(self, max_size: int, ttl: float):
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries: "OrderedDict[Tuple, Tuple[float, str]]" = OrderedDict()
+    
+    def get(self, key: Tuple) -> Optional[str]:
+        """Return the cached response for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        stored_at, response = entry
+        if time.monotonic() - stored_at > self._ttl:
+            del self._entries[key]
+            return None
+        
+        self._entries.move_to_end(key)
+        return response
+    
+    def put(self, key: Tuple, response: str) -> None:
+        """Store a response, evicting the least recently used entries if full."""
+        self._entries[key] = (time.monotonic(), response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+
+_response_cache = _ResponseCache(RESPONSE_CACHE_SIZE, RESPONSE_CACHE_TTL)
+
+# Gemini calls in flight, keyed like the response cache, so identical
+# concurrent questions share a single request
+_pending_responses: Dict[Tuple, "asyncio.Future[Optional[str]]"] = {}
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env() -> None:
+    """Load the environment variables from the .env file (once)."""
+    from dotenv import load_dotenv
+    load_dotenv()
+
+
+@functools.lru_cache(maxsize=1)
 def get_gemini_api_key() -> Optional[str]:
     """Get Gemini API key from environment."""
+    _load_env()
     key = os.getenv("GEMINI_API_KEY")
     if key:
         # Strip whitespace and remove quotes if present
@@ -24,10 +80,15 @@ def get_gemini_api_key() -> Optional[str]:
     return key if key else None
 
 
+@functools.lru_cache(maxsize=1)
 def _get_client_and_model():
     """
     Get or create the Gemini client and model.
     
+    Cached so the AsyncOpenAI client and its connection pool are reused
+    across requests instead of being rebuilt per call. The agents package
+    is imported here so FAQ-only requests never pay its import cost.
+    
     Returns:
         Tuple of (external_client, model, config) or (None, None, None) if API key is not available
     """
@@ -37,6 +98,9 @@ def _get_client_and_model():
         return None, None, None
     
     try:
+        from agents import AsyncOpenAI, OpenAIChatCompletionsModel
+        from agents.run import RunConfig
+        
         # Reference: https://ai.google.dev/gemini-api/docs/openai
         external_client = AsyncOpenAI(
             api_key=gemini_api_key,
@@ -60,7 +124,8 @@ def _get_client_and_model():
         return None, None, None
 
 
-def _get_agent(model) -> Optional[Agent]:
+@functools.lru_cache(maxsize=1)
+def _get_agent(model) -> Optional["Agent"]:
     """
     Get or create the AI agent instance.
     
@@ -74,6 +139,8 @@ def _get_agent(model) -> Optional[Agent]:
         return None
     
     try:
+        from agents import Agent
+        
         # Create agent with customer support instructions
         agent = Agent(
             name="CustomerSupportAssistant",
@@ -101,6 +168,98 @@ When answering questions:
         return None
 
 
+# Separator line between prompt sections
+_SEP = "=" * 60
+
+# Closing instructions appended after the customer question
+_PROMPT_FOOTER = (
+    f"\n\n{_SEP}\n"
+    "Please provide a helpful, professional, and clear response to this FAQ. "
+    "If the question matches one of the FAQs above, use that answer as a reference. "
+    "If this is not a product/service FAQ, politely decline. "
+    "Keep your response brief (2-3 sentences) and directly address the question."
+)
+
+
+@functools.cache
+def _get_prompt_header() -> str:
+    """
+    Build the static prompt prefix containing the FAQ knowledge base.
+    
+    Returns:
+        Prompt text up to the customer details
+    """
+    from .faq_knowledge_base import format_faqs_as_json
+    
+    return (
+        f"FREQUENTLY ASKED QUESTIONS (FAQs, JSON list of q/a pairs):\n{_SEP}\n"
+        f"Use the following FAQs as reference when answering questions:\n"
+        f"{format_faqs_as_json()}\n{_SEP}\n"
+        f"\nCUSTOMER QUESTION:\n{_SEP}\n"
+    )
+
+
+def _build_prompt(
+    user_message: str,
+    customer_name: Optional[str] = None,
+    customer_email: Optional[str] = None,
+    context: Optional[str] = None
+) -> str:
+    """
+    Build the full Gemini prompt for a customer question.
+    
+    Args:
+        user_message: The customer's support message
+        customer_name: Optional customer name
+        customer_email: Optional customer email
+        context: Optional additional context
+        
+    Returns:
+        Prompt text
+    """
+    name_line = f"Customer Name: {customer_name}\n" if customer_name else ""
+    email_line = f"Customer Email: {customer_email}\n" if customer_email else ""
+    context_line = f"Additional Context: {context}\n" if context else ""
+    
+    return (
+        f"{_get_prompt_header()}{name_line}{email_line}{context_line}"
+        f"\nCustomer Question: {user_message}{_PROMPT_FOOTER}"
+    )
+
+
+async def _run_agent(
+    agent: "Agent",
+    full_prompt: str,
+    config,
+    cache_key: Optional[Tuple]
+) -> Optional[str]:
+    """
+    Run the agent once and cache a valid response.
+    
+    Args:
+        agent: Agent to run
+        full_prompt: Prompt text
+        config: Run configuration for the agent
+        cache_key: Response cache key for this question, or None to skip caching
+        
+    Returns:
+        Response text, or None if the agent returned no usable answer
+    """
+    from agents import Runner
+    
+    result = await Runner.run(agent, full_prompt, run_config=config)
+    
+    # Extract response
+    if result and hasattr(result, 'final_output') and result.final_output:
+        response = str(result.final_output).strip()
+        if len(response) > 10:  # Valid response
+            if cache_key is not None:
+                _response_cache.put(cache_key, response)
+            return response
+    
+    return None
+
+
 async def generate_ai_response(
     user_message: str,
     customer_name: Optional[str] = None,
@@ -110,7 +269,8 @@ async def generate_ai_response(
     """
     Generate an AI-powered response to a customer support message.
     
-    First checks FAQ knowledge base, then uses Gemini AI if no match found.
+    First checks FAQ knowledge base, then a short-lived cache of recent
+    Gemini answers, and finally calls Gemini AI.
     
     Args:
         user_message: The customer's support message
@@ -123,7 +283,7 @@ async def generate_ai_response(
     """
     try:
         # First, check if there's a matching FAQ in the knowledge base
-        from .faq_knowledge_base import find_matching_faq, format_faqs_for_prompt
+        from .faq_knowledge_base import find_matching_faq
         
         matching_faq = find_matching_faq(user_message)
         
@@ -139,7 +299,16 @@ async def generate_ai_response(
             
             return answer
         
-        # No FAQ match found, use AI agent
+        # No FAQ match found, reuse a recent answer to the same question
+        normalized_message = user_message.lower().strip()
+        cache_key = None
+        if len(normalized_message) <= RESPONSE_CACHE_MAX_KEY_LENGTH:
+            cache_key = (normalized_message, customer_name, customer_email, context)
+            cached_response = _response_cache.get(cache_key)
+            if cached_response is not None:
+                return cached_response
+        
+        # Otherwise use AI agent
         external_client, model, config = _get_client_and_model()
         
         if not model or not config:
@@ -151,46 +320,24 @@ async def generate_ai_response(
             return MOCK_RESPONSE
         
         # Build the prompt with context and FAQs
-        prompt_parts = []
-        
-        # Add FAQ knowledge base to prompt
-        faq_text = format_faqs_for_prompt()
-        prompt_parts.append("FREQUENTLY ASKED QUESTIONS (FAQs):")
-        prompt_parts.append("=" * 60)
-        prompt_parts.append("Use the following FAQs as reference when answering questions:")
-        prompt_parts.append(faq_text)
-        prompt_parts.append("=" * 60)
-        prompt_parts.append("\nCUSTOMER QUESTION:")
-        prompt_parts.append("=" * 60)
-        
-        if customer_name:
-            prompt_parts.append(f"Customer Name: {customer_name}")
-        
-        if customer_email:
-            prompt_parts.append(f"Customer Email: {customer_email}")
-        
-        if context:
-            prompt_parts.append(f"Additional Context: {context}")
-        
-        prompt_parts.append(f"\nCustomer Question: {user_message}")
-        prompt_parts.append("\n" + "=" * 60)
-        prompt_parts.append(
-            "Please provide a helpful, professional, and clear response to this FAQ. "
-            "If the question matches one of the FAQs above, use that answer as a reference. "
-            "If this is not a product/service FAQ, politely decline. "
-            "Keep your response brief (2-3 sentences) and directly address the question."
-        )
-        
-        full_prompt = "\n".join(prompt_parts)
+        full_prompt = _build_prompt(user_message, customer_name, customer_email, context)
         
-        # Run the agent
-        result = await Runner.run(agent, full_prompt, run_config=config)
-        
-        # Extract response
-        if result and hasattr(result, 'final_output') and result.final_output:
-            response = str(result.final_output).strip()
-            if len(response) > 10:  # Valid response
-                return response
+        if cache_key is None:
+            response = await _run_agent(agent, full_prompt, config, None)
+        else:
+            # Run the agent, joining an identical request that is already in flight
+            pending = _pending_responses.get(cache_key)
+            if pending is None:
+                pending = asyncio.ensure_future(
+                    _run_agent(agent, full_prompt, config, cache_key)
+                )
+                _pending_responses[cache_key] = pending
+                pending.add_done_callback(lambda _: _pending_responses.pop(cache_key, None))
+            
+            # Shield so one caller disconnecting does not cancel the shared call
+            response = await asyncio.shield(pending)
+        if response:
+            return response
         
         # If response is invalid, return mock
         return MOCK_RESPONSE
@@ -202,6 +349,7 @@ async def generate_ai_response(
         return MOCK_RESPONSE
 
 
+@functools.lru_cache(maxsize=1)
 def get_ai_agent():
     """
     Get the AI agent instance (for compatibility with existing code).
@@ -214,15 +362,27 @@ def get_ai_agent():
 
 # For backward compatibility
 class AIAgent:
-    """Wrapper class for backward compatibility."""
+    """Wrapper class for backward compatibility.
     
-    def __init__(self):
-        external_client, model, config = _get_client_and_model()
-        self.agent = _get_agent(model) if model else None
-        self.gemini_client = self.agent is not None
-        self.openai_client = None
-        self._model = model
-        self._config = config
+    Holds no state of its own; attributes delegate to the cached module-level
+    client and agent accessors.
+    """
+    
+    @property
+    def agent(self) -> Optional["Agent"]:
+        """The shared Gemini-backed agent, or None if unavailable."""
+        _, model, _ = _get_client_and_model()
+        return _get_agent(model) if model else None
+    
+    @property
+    def gemini_client(self) -> bool:
+        """Whether the Gemini client and agent are initialized."""
+        return self.agent is not None
+    
+    @property
+    def openai_client(self) -> None:
+        """Kept for compatibility; the OpenAI client is not used."""
+        return None
     
     async def generate_response(
         self,
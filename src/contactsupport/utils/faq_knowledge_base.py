@@ -2,8 +2,11 @@
 FAQ Knowledge Base
 Contains predefined FAQs and answers for the AI agent to reference.
 """
+from collections import defaultdict
 from typing import List, Dict, Optional
+import functools
 import re
+import orjson
 
 
 # FAQ Knowledge Base
@@ -131,11 +134,122 @@ FAQ_DATABASE = [
 ]
 
 
+def _build_question_index() -> Dict[str, int]:
+    """
+    Map each normalized FAQ question to its index in FAQ_DATABASE.
+    
+    The first occurrence of a duplicated question wins, matching the order
+    in which FAQs are scanned.
+    
+    Returns:
+        Dict of normalized question to FAQ index
+    """
+    index: Dict[str, int] = {}
+    for i, faq in enumerate(FAQ_DATABASE):
+        index.setdefault(faq["question"].lower().strip(), i)
+    return index
+
+
+# Normalized FAQ question -> index in FAQ_DATABASE, for O(1) exact matches
+_FAQ_INDEX_BY_QUESTION = _build_question_index()
+
+# Separator line used when formatting FAQs for the AI prompt
+_SEP = "=" * 60
+
+# Word tokenizer and stop words ignored when comparing questions
+_TOKEN_RE = re.compile(r'\b\w+\b')
+_STOP_WORDS = frozenset({
+    'i', 'my', 'me', 'you', 'your', 'the', 'a', 'an', 'is', 'are',
+    'was', 'were', 'do', 'does', 'did', 'can', 'could', 'what',
+    'how', 'where', 'when', 'why', 'who', 'which', 'this', 'that',
+    'to', 'for', 'of', 'in', 'on', 'at', 'by', 'with', 'from'
+})
+
+# Phrases that boost a match when found in both questions
+_KEY_PHRASES = (
+    'reset password', 'forgot password', 'password reset',
+    'refund policy', 'refund',
+    '24/7', 'customer support', 'contact support',
+    'change email', 'update email', 'email address',
+    'delete account',
+    'payment method', 'payment',
+    'upgrade plan', 'downgrade plan', 'subscription',
+    'free trial',
+    'data secure', 'data security', 'privacy',
+    'mobile device', 'mobile',
+    'password reset email',
+    'process refund', 'refund time',
+    'share account',
+    'billing information', 'update billing',
+    'system updates', 'notifications',
+    'pause subscription',
+    'training', 'onboarding',
+    'technical issue', 'bug', 'report bug',
+    'export data'
+)
+
+# Keywords of each FAQ question (minus stop words) and their counts, built once
+_FAQ_KEYWORDS: List[frozenset] = [
+    frozenset(_TOKEN_RE.findall(faq["question"].lower())) - _STOP_WORDS
+    for faq in FAQ_DATABASE
+]
+_FAQ_KEYWORD_COUNT: List[int] = [max(len(keywords), 1) for keywords in _FAQ_KEYWORDS]
+
+# One bit per FAQ keyword, and each FAQ's keywords encoded as a bitmask, so
+# keyword overlap is a single AND plus popcount
+_KEYWORD_BITS: Dict[str, int] = {
+    keyword: 1 << bit
+    for bit, keyword in enumerate(sorted(frozenset().union(*_FAQ_KEYWORDS)))
+}
+_FAQ_KEYWORD_MASKS: List[int] = [
+    sum(_KEYWORD_BITS[keyword] for keyword in keywords) for keywords in _FAQ_KEYWORDS
+]
+
+
+def _build_postings() -> Dict[str, List[int]]:
+    """
+    Build an inverted index from FAQ keyword to the FAQs containing it.
+    
+    Returns:
+        Dict of keyword to ascending FAQ indices
+    """
+    postings: Dict[str, List[int]] = defaultdict(list)
+    for i, keywords in enumerate(_FAQ_KEYWORDS):
+        for keyword in keywords:
+            postings[keyword].append(i)
+    return dict(postings)
+
+
+# Keyword -> indices of FAQs whose question contains it
+_POSTINGS = _build_postings()
+
+# One bit per key phrase, and the key phrases contained in each FAQ
+# question encoded as a bitmask, built once
+_PHRASE_BITS: Dict[str, int] = {
+    phrase: 1 << bit for bit, phrase in enumerate(_KEY_PHRASES)
+}
+_FAQ_PHRASE_MASKS: List[int] = [
+    sum(bit for phrase, bit in _PHRASE_BITS.items() if phrase in faq["question"].lower())
+    for faq in FAQ_DATABASE
+]
+
+# Score added when a key phrase appears in both questions; a keyword score
+# is at most 1.0, so no FAQ can score higher than _MAX_SCORE
+_PHRASE_BOOST = 0.3
+_MAX_SCORE = 1.0 + _PHRASE_BOOST
+
+# Questions longer than this rarely repeat, so they bypass the match cache
+# instead of pinning up to MAX_MESSAGE_LENGTH characters per entry
+_MATCH_CACHE_MAX_KEY_LENGTH = 256
+
+
 def find_matching_faq(user_question: str) -> Optional[Dict[str, str]]:
     """
     Find a matching FAQ from the knowledge base based on user question.
     
     Uses keyword matching and similarity scoring to find the best match.
+    Results are cached per normalized question, since short questions often
+    repeat; longer free-text messages are matched without caching.
     
     Args:
         user_question: The user's question
@@ -144,73 +258,74 @@ def find_matching_faq(user_question: str) -> Optional[Dict[str, str]]:
         Matching FAQ dict with question and answer, or None if no match found
     """
     user_question_lower = user_question.lower().strip()
+    if len(user_question_lower) > _MATCH_CACHE_MAX_KEY_LENGTH:
+        match_index = _match_faq_index.__wrapped__(user_question_lower)
+    else:
+        match_index = _match_faq_index(user_question_lower)
+    if match_index is None:
+        return None
+    return FAQ_DATABASE[match_index]
+
+
+@functools.lru_cache(maxsize=4096)
+def _match_faq_index(user_question_lower: str) -> Optional[int]:
+    """
+    Find the index of the best matching FAQ for a normalized question.
     
+    Args:
+        user_question_lower: The user's question, lowercased and stripped
+        
+    Returns:
+        Index into FAQ_DATABASE, or None if no match found
+    """
     # Direct exact match (case-insensitive)
-    for faq in FAQ_DATABASE:
-        if faq["question"].lower().strip() == user_question_lower:
-            return faq
+    exact_index = _FAQ_INDEX_BY_QUESTION.get(user_question_lower)
+    if exact_index is not None:
+        return exact_index
     
     # Keyword-based matching
     best_match = None
     best_score = 0
     
-    for faq in FAQ_DATABASE:
-        faq_question_lower = faq["question"].lower()
-        faq_answer_lower = faq["answer"].lower()
-        
-        # Extract keywords from FAQ question
-        faq_keywords = set(re.findall(r'\b\w+\b', faq_question_lower))
-        user_keywords = set(re.findall(r'\b\w+\b', user_question_lower))
-        
-        # Calculate similarity score
-        common_keywords = faq_keywords.intersection(user_keywords)
-        
-        # Remove common stop words
-        stop_words = {'i', 'my', 'me', 'you', 'your', 'the', 'a', 'an', 'is', 'are', 
-                     'was', 'were', 'do', 'does', 'did', 'can', 'could', 'what', 
-                     'how', 'where', 'when', 'why', 'who', 'which', 'this', 'that',
-                     'to', 'for', 'of', 'in', 'on', 'at', 'by', 'with', 'from'}
+    # Encode the user question's keywords once and collect the FAQs sharing
+    # at least one of them; unknown words match no FAQ
+    user_mask = 0
+    candidates = set()
+    for keyword in frozenset(_TOKEN_RE.findall(user_question_lower)) - _STOP_WORDS:
+        postings = _POSTINGS.get(keyword)
+        if postings:
+            user_mask |= _KEYWORD_BITS[keyword]
+            candidates.update(postings)
+    
+    if not candidates:
+        return None
+    
+    # Find the key phrases in the user question once, not once per FAQ
+    user_phrase_mask = 0
+    for phrase, bit in _PHRASE_BITS.items():
+        if phrase in user_question_lower:
+            user_phrase_mask |= bit
+    
+    # Score candidates in FAQ order so ties keep the earlier FAQ
+    for i in sorted(candidates):
+        # Calculate score based on common keywords
+        common_count = (_FAQ_KEYWORD_MASKS[i] & user_mask).bit_count()
+        score = common_count / _FAQ_KEYWORD_COUNT[i]
         
-        common_keywords = common_keywords - stop_words
+        # Boost score if a key phrase appears in both questions
+        if _FAQ_PHRASE_MASKS[i] & user_phrase_mask:
+            score += _PHRASE_BOOST
         
-        if len(common_keywords) > 0:
-            # Calculate score based on common keywords
-            score = len(common_keywords) / max(len(faq_keywords - stop_words), 1)
+        if score > best_score:
+            best_score = score
+            best_match = i
             
-            # Boost score if key phrases match
-            key_phrases = [
-                'reset password', 'forgot password', 'password reset',
-                'refund policy', 'refund',
-                '24/7', 'customer support', 'contact support',
-                'change email', 'update email', 'email address',
-                'delete account',
-                'payment method', 'payment',
-                'upgrade plan', 'downgrade plan', 'subscription',
-                'free trial',
-                'data secure', 'data security', 'privacy',
-                'mobile device', 'mobile',
-                'password reset email',
-                'process refund', 'refund time',
-                'share account',
-                'billing information', 'update billing',
-                'system updates', 'notifications',
-                'pause subscription',
-                'training', 'onboarding',
-                'technical issue', 'bug', 'report bug',
-                'export data'
-            ]
-            
-            for phrase in key_phrases:
-                if phrase in user_question_lower and phrase in faq_question_lower:
-                    score += 0.3
-                    break
-            
-            if score > best_score:
-                best_score = score
-                best_match = faq
+            # Later FAQs can only tie, and ties keep the earlier FAQ
+            if best_score >= _MAX_SCORE:
+                break
     
     # Return match if score is above threshold
-    if best_match and best_score >= 0.3:
+    if best_match is not None and best_score >= 0.3:
         return best_match
     
     return None
@@ -226,19 +341,34 @@ def get_all_faqs() -> List[Dict[str, str]]:
     return FAQ_DATABASE.copy()
 
 
+@functools.cache
 def format_faqs_for_prompt() -> str:
     """
     Format FAQs for inclusion in AI prompt.
     
+    FAQ_DATABASE is constant, so the text is built once and reused.
+    
     Returns:
         Formatted string of FAQs
     """
-    faq_text = "FREQUENTLY ASKED QUESTIONS (FAQs):\n"
-    faq_text += "=" * 60 + "\n\n"
+    faq_entries = "".join(
+        f"{i}. Q: {faq['question']}\n   A: {faq['answer']}\n\n"
+        for i, faq in enumerate(FAQ_DATABASE, 1)
+    )
+    return f"FREQUENTLY ASKED QUESTIONS (FAQs):\n{_SEP}\n\n{faq_entries}"
+
+
+@functools.cache
+def format_faqs_as_json() -> str:
+    """
+    Format FAQs as a compact JSON list for inclusion in AI prompt.
     
-    for i, faq in enumerate(FAQ_DATABASE, 1):
-        faq_text += f"{i}. Q: {faq['question']}\n"
-        faq_text += f"   A: {faq['answer']}\n\n"
+    Uses fewer prompt tokens than the numbered text format and is built once.
     
-    return faq_text
-
+    Returns:
+        JSON string of ``{"q": question, "a": answer}`` objects
+    """
+    return orjson.dumps([
+        {"q": faq["question"].strip(), "a": faq["answer"].strip()}
+        for faq in FAQ_DATABASE
+    ]).decode()
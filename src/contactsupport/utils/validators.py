@@ -5,60 +5,109 @@ import re
 from typing import Optional
 from fastapi import HTTPException, status
 
+# Maximum support message length, in characters
+MAX_MESSAGE_LENGTH = 10000
+
+# Compiled once at import instead of on every validation
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+
 
 def validate_email(email: str) -> bool:
     """
     Validate email format.
     
+    The whole string must match, so a trailing newline is rejected.
+    
     Args:
         email: Email address to validate
         
     Returns:
         True if email is valid, False otherwise
     """
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    return _EMAIL_RE.fullmatch(email) is not None
 
 
-def validate_support_message_data(name: str, email: str, message: str) -> None:
+def ensure_valid_name(name: Optional[str]) -> str:
     """
-    Validate support message data.
+    Check that a customer name is present.
     
     Args:
         name: Customer name
-        email: Customer email
-        message: Support message
+        
+    Returns:
+        The name, unchanged
         
     Raises:
-        HTTPException: If validation fails
+        ValueError: If the name is empty
     """
     if not name or not name.strip():
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Name is required and cannot be empty"
-        )
+        raise ValueError("Name is required and cannot be empty")
+    return name
+
+
+def ensure_valid_email(email: Optional[str]) -> str:
+    """
+    Check that an email address is present and well formed.
     
+    Args:
+        email: Customer email
+        
+    Returns:
+        The email, unchanged
+        
+    Raises:
+        ValueError: If the email is empty or invalid
+    """
     if not email or not email.strip():
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email is required and cannot be empty"
-        )
+        raise ValueError("Email is required and cannot be empty")
     
     if not validate_email(email):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid email format"
+        raise ValueError("Invalid email format")
+    return email
+
+
+def ensure_valid_message(message: Optional[str]) -> str:
+    """
+    Check that a support message is present and not too long.
+    
+    Args:
+        message: Support message
+        
+    Returns:
+        The message, unchanged
+        
+    Raises:
+        ValueError: If the message is empty or too long
+    """
+    # Length is checked first so oversized bodies are never copied by strip()
+    if message and len(message) > MAX_MESSAGE_LENGTH:
+        raise ValueError(
+            f"Message is too long. Maximum length is {MAX_MESSAGE_LENGTH} characters"
         )
     
     if not message or not message.strip():
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Message is required and cannot be empty"
-        )
+        raise ValueError("Message is required and cannot be empty")
+    return message
+
+
+def validate_support_message_data(name: str, email: str, message: str) -> None:
+    """
+    Validate support message data.
     
-    if len(message) > 10000:
+    Args:
+        name: Customer name
+        email: Customer email
+        message: Support message
+        
+    Raises:
+        HTTPException: If validation fails
+    """
+    try:
+        ensure_valid_name(name)
+        ensure_valid_email(email)
+        ensure_valid_message(message)
+    except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Message is too long. Maximum length is 10000 characters"
+            detail=str(e)
         )
-